@@ -5,10 +5,13 @@ Generates meaningful insights from cleaned data
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless raster backend; no GUI event loop to spin up
 import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import json
+import os
 from typing import List, Dict, Any, Optional
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
@@ -16,6 +19,70 @@ from sklearn.decomposition import PCA
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+try:
+    from numba import njit
+except ImportError:
+    # No-op stand-in so the stats kernel below still runs without numba
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def _column_stats(values):
+    """Compute Q1, Q3, skewness and IQR outlier count in one fused pass"""
+    values = values[~np.isnan(values)]
+    n = values.size
+    if n < 3:
+        return np.nan, np.nan, 0.0, 0
+
+    sorted_vals = np.sort(values)
+
+    # Linear-interpolated quantiles, same convention as Series.quantile
+    pos = 0.25 * (n - 1)
+    lo = int(pos)
+    hi = lo + 1 if lo + 1 < n else lo
+    q1 = sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (pos - lo)
+    pos = 0.75 * (n - 1)
+    lo = int(pos)
+    hi = lo + 1 if lo + 1 < n else lo
+    q3 = sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (pos - lo)
+
+    # Adjusted Fisher-Pearson skewness, same convention as Series.skew
+    mean = sorted_vals.mean()
+    deltas = sorted_vals - mean
+    m2 = (deltas * deltas).sum()
+    m3 = (deltas * deltas * deltas).sum()
+    variance = m2 / (n - 1)
+    if variance > 0:
+        skewness = (n / ((n - 1.0) * (n - 2.0))) * m3 / variance ** 1.5
+    else:
+        skewness = 0.0
+
+    iqr = q3 - q1
+    outliers = ((sorted_vals < q1 - 1.5 * iqr) | (sorted_vals > q3 + 1.5 * iqr)).sum()
+    return q1, q3, skewness, int(outliers)
+
+
+def _profile_column(values: np.ndarray) -> Dict[str, Any]:
+    """Per-column reductions; NumPy releases the GIL so these run well in threads"""
+    _, _, skewness, outliers = _column_stats(values)
+    valid = values[~np.isnan(values)]
+    if valid.size == 0:
+        return {'mean': np.nan, 'std': np.nan, 'min': np.nan, 'max': np.nan,
+                'median': np.nan, 'skew': 0.0, 'outliers': 0}
+    return {'mean': valid.mean(), 'std': valid.std(ddof=1), 'min': valid.min(),
+            'max': valid.max(), 'median': np.median(valid),
+            'skew': skewness, 'outliers': outliers}
+
 class InsightGenerator:
     """
     Generates key insights from any dataset
@@ -23,7 +90,9 @@ class InsightGenerator:
     
     def __init__(self):
         self.insights = []
-        
+        self._numeric_stats = {}
+
+
     def generate_insights(self, data_path: str, visual: bool = False) -> List[str]:
         """Generate comprehensive insights from the dataset"""
         try:
@@ -33,7 +102,18 @@ class InsightGenerator:
                 return ["❌ Could not load data for analysis"]
             
             print(f"🔍 Generating insights for dataset with {len(df)} rows and {len(df.columns)} columns")
-            
+
+            # Profile all numeric columns once, in parallel; the helpers below
+            # read from this cache instead of rescanning the frame
+            self._numeric_stats = self._compute_numeric_stats(df)
+
+            # Convert low-cardinality text columns to categoricals so the
+            # nunique/value_counts/mode calls below hash each distinct string
+            # once and then work on integer codes
+            for col in df.select_dtypes(include=['object', 'string']).columns:
+                if df[col].nunique() < len(df) * 0.5:
+                    df[col] = df[col].astype('category')
+
             insights = []
             
             # Basic statistics
@@ -72,7 +152,25 @@ class InsightGenerator:
         """Load data from file"""
         try:
             path = Path(data_path)
+            # Prefer an up-to-date Parquet sibling written by DataProcessor:
+            # columnar load with dtypes preserved, no CSV re-parse
+            parquet_path = path.with_suffix('.parquet')
+            if parquet_path.exists() and path.exists() \
+                    and parquet_path.stat().st_mtime >= path.stat().st_mtime:
+                try:
+                    return pd.read_parquet(parquet_path, engine='pyarrow')
+                except Exception:
+                    pass
             if path.suffix.lower() == '.csv':
+                if pacsv is not None:
+                    try:
+                        table = pacsv.read_csv(
+                            data_path,
+                            read_options=pacsv.ReadOptions(block_size=8 << 20, use_threads=True)
+                        )
+                        return table.to_pandas(self_destruct=True, split_blocks=True)
+                    except Exception:
+                        pass
                 return pd.read_csv(data_path)
             elif path.suffix.lower() == '.json':
                 return pd.read_json(data_path)
@@ -84,6 +182,25 @@ class InsightGenerator:
             print(f"Error loading data: {e}")
             return None
     
+    def _compute_numeric_stats(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """Profile all numeric columns concurrently with a thread pool"""
+        numeric_cols = list(df.select_dtypes(include=[np.number]).columns)
+        if not numeric_cols:
+            return {}
+        arrays = [df[col].to_numpy(dtype=np.float64) for col in numeric_cols]
+        workers = min(len(arrays), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            profiles = list(executor.map(_profile_column, arrays))
+        return dict(zip(numeric_cols, profiles))
+
+    def _column_profile(self, df: pd.DataFrame, col: str) -> Dict[str, Any]:
+        """Return the cached profile for a numeric column, computing it on demand"""
+        stats = self._numeric_stats.get(col)
+        if stats is None:
+            stats = _profile_column(df[col].to_numpy(dtype=np.float64))
+            self._numeric_stats[col] = stats
+        return stats
+
     def _basic_statistics(self, df: pd.DataFrame) -> List[str]:
         """Generate basic statistical insights"""
         insights = []
@@ -98,12 +215,11 @@ class InsightGenerator:
             
             # Summary statistics
             for col in numeric_cols[:3]:  # Top 3 numeric columns
-                mean_val = df[col].mean()
-                std_val = df[col].std()
-                insights.append(f"   • {col}: Mean = {mean_val:.2f}, Std = {std_val:.2f}")
+                stats = self._column_profile(df, col)
+                insights.append(f"   • {col}: Mean = {stats['mean']:.2f}, Std = {stats['std']:.2f}")
         
         # Categorical columns analysis
-        text_cols = df.select_dtypes(include=['object', 'string']).columns
+        text_cols = df.select_dtypes(include=['object', 'string', 'category']).columns
         if len(text_cols) > 0:
             insights.append(f"📝 Found {len(text_cols)} categorical attributes")
             
@@ -147,18 +263,16 @@ class InsightGenerator:
         
         # Analyze each column
         for col in df.columns[:5]:  # Limit to first 5 columns for brevity
-            if df[col].dtype in ['object', 'string']:
+            if df[col].dtype in ['object', 'string', 'category']:
                 # Categorical analysis
                 unique_count = df[col].nunique()
                 most_common = df[col].mode().iloc[0] if len(df[col].mode()) > 0 else "N/A"
                 insights.append(f"📋 {col}: {unique_count} categories, most common = '{most_common}'")
                 
-            elif df[col].dtype in [np.number]:
-                # Numeric analysis
-                min_val = df[col].min()
-                max_val = df[col].max()
-                median_val = df[col].median()
-                insights.append(f"📈 {col}: Range [{min_val:.2f} - {max_val:.2f}], Median = {median_val:.2f}")
+            elif col in self._numeric_stats or pd.api.types.is_numeric_dtype(df[col]):
+                # Numeric analysis from the shared profile cache
+                stats = self._column_profile(df, col)
+                insights.append(f"📈 {col}: Range [{stats['min']:.2f} - {stats['max']:.2f}], Median = {stats['median']:.2f}")
         
         return insights
     
@@ -168,21 +282,30 @@ class InsightGenerator:
         
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         if len(numeric_cols) >= 2:
-            corr_matrix = df[numeric_cols].corr()
-            
-            # Find strong correlations (>0.7 or <-0.7)
-            strong_corr = []
-            for i in range(len(corr_matrix.columns)):
-                for j in range(i+1, len(corr_matrix.columns)):
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.7:
-                        col1, col2 = corr_matrix.columns[i], corr_matrix.columns[j]
-                        strong_corr.append((col1, col2, corr_val))
-            
-            if strong_corr:
-                insights.append(f"🔗 Found {len(strong_corr)} strong correlations:")
-                for col1, col2, corr_val in strong_corr[:3]:  # Top 3
-                    insights.append(f"   • {col1} ↔ {col2}: {corr_val:.3f}")
+            # float32 halves memory traffic and np.corrcoef on the contiguous
+            # transposed block dispatches the centering/products to BLAS.
+            # np.corrcoef propagates NaN, so frames with missing values keep
+            # pandas' pairwise-excluding .corr()
+            block = df[numeric_cols].to_numpy(dtype=np.float32)
+            if np.isnan(block).any():
+                corr_matrix = df[numeric_cols].corr().to_numpy(dtype=np.float32)
+            else:
+                corr_matrix = np.corrcoef(np.ascontiguousarray(block.T))
+
+            # Find strong correlations (>0.7 or <-0.7) via the upper triangle
+            rows, cols = np.triu_indices_from(corr_matrix, k=1)
+            corr_vals = corr_matrix[rows, cols]
+            abs_vals = np.abs(corr_vals)
+            strong = np.where(abs_vals > 0.7)[0]
+
+            if len(strong) > 0:
+                insights.append(f"🔗 Found {len(strong)} strong correlations:")
+                # Top 3 by magnitude via O(N) partial selection, no full sort
+                if len(strong) > 3:
+                    strong = strong[np.argpartition(-abs_vals[strong], 3)[:3]]
+                for idx in strong:
+                    col1, col2 = numeric_cols[rows[idx]], numeric_cols[cols[idx]]
+                    insights.append(f"   • {col1} ↔ {col2}: {corr_vals[idx]:.3f}")
             else:
                 insights.append("📊 No strong correlations found between numeric attributes")
         
@@ -195,18 +318,15 @@ class InsightGenerator:
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         
         for col in numeric_cols[:3]:  # Analyze top 3 numeric columns
+            stats = self._column_profile(df, col)
+            skewness, outliers = stats['skew'], stats['outliers']
+
             # Check for normal distribution
-            skewness = df[col].skew()
             if abs(skewness) > 1:
                 direction = "right" if skewness > 0 else "left"
                 insights.append(f"📊 {col} shows {direction}-skewed distribution (skewness: {skewness:.2f})")
-            
+
             # Check for outliers
-            Q1 = df[col].quantile(0.25)
-            Q3 = df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            outliers = ((df[col] < Q1 - 1.5*IQR) | (df[col] > Q3 + 1.5*IQR)).sum()
-            
             if outliers > 0:
                 insights.append(f"🎯 {col}: {outliers} potential outliers detected")
         
@@ -224,13 +344,19 @@ class InsightGenerator:
                 insights.append(f"📅 Time span in {col}: {date_range.days if hasattr(date_range, 'days') else 'N/A'} days")
         
         # Categorical patterns
-        text_cols = df.select_dtypes(include=['object', 'string']).columns
+        text_cols = df.select_dtypes(include=['object', 'string', 'category']).columns
         for col in text_cols[:2]:  # Top 2 categorical columns
-            value_counts = df[col].value_counts()
-            if len(value_counts) > 1:
-                dominant_percent = (value_counts.iloc[0] / len(df)) * 100
+            # Count on categorical integer codes: one bincount pass instead of
+            # value_counts sorting the whole distribution for a single argmax
+            series = df[col] if isinstance(df[col].dtype, pd.CategoricalDtype) \
+                else df[col].astype('category')
+            codes = series.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+            if (counts > 0).sum() > 1:
+                top = counts.argmax()
+                dominant_percent = (counts[top] / len(df)) * 100
                 if dominant_percent > 50:
-                    insights.append(f"🎯 {col}: '{value_counts.index[0]}' dominates ({dominant_percent:.1f}%)")
+                    insights.append(f"🎯 {col}: '{series.cat.categories[top]}' dominates ({dominant_percent:.1f}%)")
         
         return insights
     
@@ -266,54 +392,64 @@ class InsightGenerator:
         try:
             plt.style.use('default')
             fig_count = 1
-            
+            # One figure reused for every plot; fig.clear() avoids re-initializing
+            # the canvas and layout machinery per chart
+            fig = plt.figure()
+
             # 1. Correlation heatmap for numeric columns
             numeric_cols = df.select_dtypes(include=[np.number]).columns
             if len(numeric_cols) >= 2:
-                plt.figure(figsize=(10, 8))
+                fig.clear()
+                fig.set_size_inches(10, 8)
+                ax = fig.add_subplot(111)
                 corr_matrix = df[numeric_cols].corr()
-                sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0)
-                plt.title('Correlation Matrix')
-                plt.tight_layout()
-                plt.savefig(f'correlation_matrix_{fig_count}.png', dpi=300, bbox_inches='tight')
-                plt.close()
+                image = ax.imshow(corr_matrix, cmap='coolwarm', vmin=-1, vmax=1)
+                ax.set_xticks(range(len(numeric_cols)))
+                ax.set_xticklabels(numeric_cols, rotation=45, ha='right')
+                ax.set_yticks(range(len(numeric_cols)))
+                ax.set_yticklabels(numeric_cols)
+                fig.colorbar(image, ax=ax)
+                ax.set_title('Correlation Matrix')
+                fig.savefig(f'correlation_matrix_{fig_count}.png', dpi=150)
                 fig_count += 1
-            
+
             # 2. Distribution plots for top numeric columns
-            for i, col in enumerate(numeric_cols[:3]):
-                plt.figure(figsize=(10, 6))
-                plt.subplot(1, 2, 1)
-                df[col].hist(bins=30, alpha=0.7)
-                plt.title(f'Distribution of {col}')
-                plt.xlabel(col)
-                plt.ylabel('Frequency')
-                
-                plt.subplot(1, 2, 2)
-                df[col].plot(kind='box')
-                plt.title(f'Box Plot of {col}')
-                plt.ylabel(col)
-                
-                plt.tight_layout()
-                plt.savefig(f'distribution_{col}_{fig_count}.png', dpi=300, bbox_inches='tight')
-                plt.close()
+            for col in numeric_cols[:3]:
+                values = df[col].dropna()
+                fig.clear()
+                fig.set_size_inches(10, 6)
+                ax = fig.add_subplot(1, 2, 1)
+                ax.hist(values, bins=30, alpha=0.7)
+                ax.set_title(f'Distribution of {col}')
+                ax.set_xlabel(col)
+                ax.set_ylabel('Frequency')
+
+                ax = fig.add_subplot(1, 2, 2)
+                ax.boxplot(values)
+                ax.set_title(f'Box Plot of {col}')
+                ax.set_ylabel(col)
+
+                fig.savefig(f'distribution_{col}_{fig_count}.png', dpi=150)
                 fig_count += 1
-            
+
             # 3. Categorical analysis for top text columns
-            text_cols = df.select_dtypes(include=['object', 'string']).columns
+            text_cols = df.select_dtypes(include=['object', 'string', 'category']).columns
             for col in text_cols[:2]:
                 if df[col].nunique() <= 20:  # Only if reasonable number of categories
-                    plt.figure(figsize=(12, 6))
+                    fig.clear()
+                    fig.set_size_inches(12, 6)
+                    ax = fig.add_subplot(111)
                     value_counts = df[col].value_counts().head(10)
-                    value_counts.plot(kind='bar')
-                    plt.title(f'Top Categories in {col}')
-                    plt.xlabel(col)
-                    plt.ylabel('Count')
-                    plt.xticks(rotation=45)
-                    plt.tight_layout()
-                    plt.savefig(f'categories_{col}_{fig_count}.png', dpi=300, bbox_inches='tight')
-                    plt.close()
+                    ax.bar(value_counts.index.astype(str), value_counts.to_numpy())
+                    ax.set_title(f'Top Categories in {col}')
+                    ax.set_xlabel(col)
+                    ax.set_ylabel('Count')
+                    ax.tick_params(axis='x', rotation=45)
+                    fig.savefig(f'categories_{col}_{fig_count}.png', dpi=150)
                     fig_count += 1
-                    
+
+            plt.close(fig)
+
         except Exception as e:
             print(f"Error generating visualizations: {e}")
     
@@ -5,6 +5,7 @@ A CLI-first agentic system for data cleaning, transformation, and insight genera
 """
 
 import click
+import logging
 import sys
 import os
 from pathlib import Path
@@ -12,15 +13,16 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent / "src"))
 
-from data_processor import DataProcessor
-from insight_generator import InsightGenerator
-from telangana_connector import TelanganaConnector
+# Heavy modules (pandas, matplotlib, sklearn) are imported inside each
+# command instead of here, so e.g. `fetch` doesn't pay their import cost
 
 @click.group()
 @click.version_option(version="1.0.0")
 def cli():
     """Real Time Governance System (RTGS) - Transform public data into actionable insights"""
-    pass
+    # Bare-message format keeps the emoji status lines looking the same as
+    # the prints they replaced
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
 
 @cli.command()
 @click.option('--file', '-f', type=click.Path(exists=True), help='Input data file')
@@ -29,6 +31,7 @@ def cli():
 @click.option('--format', '-fmt', type=click.Choice(['csv', 'json', 'excel']), default='csv', help='Output format')
 def clean(file, url, output, format):
     """Clean and standardize raw data"""
+    from data_processor import DataProcessor
     processor = DataProcessor()
     
     if file:
@@ -52,6 +55,7 @@ def clean(file, url, output, format):
 @click.option('--visual', '-v', is_flag=True, help='Generate visual insights')
 def analyze(file, output, visual):
     """Generate insights from cleaned data"""
+    from insight_generator import InsightGenerator
     generator = InsightGenerator()
     
     click.echo(f"🔍 Analyzing data from: {file}")
@@ -74,6 +78,7 @@ def analyze(file, output, visual):
 @click.option('--output', '-o', type=click.Path(), help='Output directory')
 def fetch(dataset, category, output):
     """Fetch data from Telangana Open Data Portal"""
+    from telangana_connector import TelanganaConnector
     connector = TelanganaConnector()
     
     if dataset:
@@ -107,6 +112,7 @@ def pipeline(file, url, output, visual):
         insights_file = "insights.txt"
     
     # Step 1: Clean data
+    from data_processor import DataProcessor
     processor = DataProcessor()
     if file:
         click.echo(f"📋 Step 1: Cleaning local file: {file}")
@@ -124,6 +130,7 @@ def pipeline(file, url, output, visual):
     
     # Step 2: Generate insights
     click.echo("📋 Step 2: Generating insights...")
+    from insight_generator import InsightGenerator
     generator = InsightGenerator()
     insights = generator.generate_insights(str(cleaned_file), visual=visual)
     